@@ -228,7 +228,8 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
                     sing = self._singularities.cached(dom, multiplicities, b)
                 except KeyError:
                     continue
-                sing += self._singularities(dom, multiplicities, not b)
+                # (do not modify the cached list in place)
+                sing = sing + self._singularities(dom, multiplicities, not b)
                 return sing
             pol = self.leading_coefficient()
         else:
@@ -598,6 +598,7 @@ from sage.functions.other import (
     ceil,
     factorial,
 )
+from sage.misc.cachefunc import cached_function
 from sage.misc.misc_c import prod
 from sage.rings.asymptotic.asymptotic_expansion_generators import asymptotic_expansions
 from sage.rings.asymptotic.asymptotic_ring import AsymptoticRing
@@ -640,18 +641,65 @@ logger = logging.getLogger(__name__)
 # Path choice
 #################################################################################
 
-def _sing_in_disk(elts, rad, large_value):
-    for j, x in enumerate(elts):
-        mag = abs(x)
-        if mag > rad:
+def _sort_by_magnitude(elts):
+    r"""
+    Sort elts by increasing magnitude (ties in the original order)
+
+    Return the sorted list, a list of enclosures of the magnitudes, and a list
+    of exact magnitudes where they are known (None elsewhere). The exact
+    magnitudes are only computed for elements whose enclosures overlap those of
+    other elements.
+    """
+    balls = sorted(((CBF(x).abs(), i, x) for i, x in enumerate(elts)),
+                   key=lambda t: t[0].lower())
+    # Split the list into groups of (transitively) overlapping enclosures,
+    # which are totally ordered
+    groups = []
+    for t in balls:
+        if groups and not t[0].lower() > groups[-1][0]:
+            groups[-1][0] = max(groups[-1][0], t[0].upper())
+            groups[-1][1].append(t)
+        else:
+            groups.append([t[0].upper(), [t]])
+    res = []
+    for _, group in groups:
+        if len(group) == 1:
+            res.append(group[0] + (None,))
+        else:
+            group = [(mag, i, x, abs(x)) for mag, i, x in group]
+            group.sort(key=lambda u: (u[3], u[1]))
+            res.extend(group)
+    return ([x for _, _, x, _ in res], [mag for mag, _, _, _ in res],
+            [exact for _, _, _, exact in res])
+
+def _exact_abs(elts, exact, j):
+    # Magnitude of elts[j], memoized in exact
+    if exact[j] is None:
+        exact[j] = abs(elts[j])
+    return exact[j]
+
+def _sing_in_disk(elts, mags, exact, rad, large_value):
+    # Compare magnitudes using their enclosures mags when they suffice to
+    # conclude, computing the exact magnitude only when the enclosures overlap
+    # and for the first element outside the disk
+    _rad = RBF(rad)
+    for j, _mag in enumerate(mags):
+        if _mag < _rad:
+            continue
+        mag = _exact_abs(elts, exact, j)
+        if _mag > _rad or mag > rad:
             return elts[:j], mag
     return elts, large_value
 
 def _choose_big_radius(all_exn_pts, dominant_sing, next_sing_rad):
     # [DMM, (11)]
-    max_smallrad = min(abs(ex - ds) for ds in dominant_sing
-                                    for ex in all_exn_pts
-                                    if ex != ds)
+    # Exact distances are costly: locate the closest pairs using balls, and
+    # only compute the distance exactly for those that cannot be ruled out
+    dists = [((CBF(ex) - CBF(ds)).abs(), ex, ds)
+             for ds in dominant_sing for ex in all_exn_pts if ex != ds]
+    dist_ub = min(d.upper() for d, _, _ in dists)
+    max_smallrad = min(abs(ex - ds) for d, ex, ds in dists
+                                    if not d.lower() > dist_ub)
     dom_rad = abs(dominant_sing[-1])
     rad = min(next_sing_rad*RBF(0.875) + dom_rad*RBF(0.125),
               dom_rad + max_smallrad*RBF(0.75))
@@ -672,18 +720,23 @@ def _check_big_radius(rad, dominant_sing):
 
 def _classify_sing(deq, known_analytic, rad):
 
+    # Potential singularities of the function
+
+    singularities = deq._singularities(QQbar, apparent=False,
+                                       multiplicities=False)
+
     # Interesting points = all sing of the equation, plus the origin
+    # (computed after the non-apparent singularities so that only the
+    # remaining apparent ones need to be computed)
 
     all_exn_pts = deq._singularities(QQbar, multiplicities=False)
     if not any(s.is_zero() for s in all_exn_pts):
         all_exn_pts.append(QQbar.zero())
 
-    # Potential singularities of the function, sorted by magnitude
+    # Sort the potential singularities by magnitude
 
-    singularities = deq._singularities(QQbar, apparent=False,
-                                       multiplicities=False)
-    singularities = [s for s in singularities if s not in known_analytic]
-    singularities.sort(key=lambda s: abs(s)) # XXX wasteful
+    singularities, sing_mags, exact_mags = _sort_by_magnitude(
+        [s for s in singularities if s not in known_analytic])
     logger.debug("potential singularities: %s", singularities)
 
     if not singularities:
@@ -696,13 +749,14 @@ def _classify_sing(deq, known_analytic, rad):
     # points of the equation lying in the disk where the function is known to be
     # analytic.
     if rad is None:
-        dominant_sing, next_sing_rad = _sing_in_disk(singularities,
-                abs(singularities[0]), abs(singularities[-1])*3)
+        dominant_sing, next_sing_rad = _sing_in_disk(singularities, sing_mags,
+                exact_mags, _exact_abs(singularities, exact_mags, 0),
+                _exact_abs(singularities, exact_mags, -1)*3)
         rad = _choose_big_radius(all_exn_pts, dominant_sing, next_sing_rad)
     else:
         rad = RBF(rad)
-        dominant_sing, _ = _sing_in_disk(singularities, rad,
-                abs(singularities[-1])*2 + rad*2)
+        dominant_sing, _ = _sing_in_disk(singularities, sing_mags, exact_mags,
+                rad, _exact_abs(singularities, exact_mags, -1)*2 + rad*2)
         _check_big_radius(rad, dominant_sing)
     logger.info("dominant singularities: %s", dominant_sing)
 
@@ -713,7 +767,20 @@ def _classify_sing(deq, known_analytic, rad):
 # (variant with error bounds of Sage's SingularityAnalysis)
 #################################################################################
 
-def truncated_psi(m, n, invz):
+_even_bernoulli_numbers = [bernoulli(0)]
+
+def _even_bernoulli(k):
+    r"""
+    The Bernoulli number B_{2k}, from a table extended on demand
+    """
+    while len(_even_bernoulli_numbers) <= k:
+        _even_bernoulli_numbers.append(
+            bernoulli(2*len(_even_bernoulli_numbers)))
+    return _even_bernoulli_numbers[k]
+
+# The expansions only depend on m, n, and the parent of invz, and are needed
+# again for every exponent at every singularity
+def truncated_psi(m, n, invz, *, cache=None):
     """
     Compute psi^(m)(z) (or, for m = 0, psi(z) - log(z)) truncated at z^(-m-2n-1)
     with an error bound of order z^(-m-2n)
@@ -722,7 +789,9 @@ def truncated_psi(m, n, invz):
 
     - n: integer, non-negative
     - m: integer, non-negative
-    - invz: element of polynomial ring, representing 1/z
+    - invz: generator of a univariate polynomial ring, representing 1/z
+    - cache (keyword, optional): dictionary where to store the result for
+      reuse in subsequent calls with the same parameters
 
     TESTS::
 
@@ -742,28 +811,52 @@ def truncated_psi(m, n, invz):
         + ([-0.5000...])*invz^4 - invz^3 - invz^2
     """
     assert n >= 1
+    assert invz == invz.parent().gen()
+    key = ('truncated_psi', m, n, invz.parent())
+    if cache is not None and key in cache:
+        return cache[key]
     CB = invz.parent().base_ring()
-    err = abs(rising_factorial(2*n + 1, m - 1)*bernoulli(2*n))
+    err = abs(rising_factorial(2*n + 1, m - 1)*_even_bernoulli(n))
     sign = (-1)**(m+1)
     ser = sign * (
         + gamma(m+1) * invz**(m+1) / 2
-        + sum(bernoulli(2*k)*invz**(2*k+m)*rising_factorial(2*k+1, m-1)
+        + sum(_even_bernoulli(k)*invz**(2*k+m)*rising_factorial(2*k+1, m-1)
               for k in range(1, n)))
     if m != 0:
         ser += sign * gamma(m) * invz**m
     res = ser + CB(0).add_error(err)*invz**(2*n+m)
+    if cache is not None:
+        cache[key] = res
     return res
 
-def _generalized_bernoulli(Ring, sigma, count):
-    t = polygen(Ring, 't')
+# Avoid going through the polynomial ring factory in the inner functions
+@cached_function
+def _polygen(Ring, name):
+    return polygen(Ring, name)
+
+def _ball_key(x):
+    # Inexact balls never compare equal, even to themselves, so that they
+    # cannot be used directly as cache keys
+    if isinstance(x.parent(), ComplexBallField):
+        return (x.parent(), x.real().mid(), x.real().rad(),
+                x.imag().mid(), x.imag().rad())
+    return (x.parent(), x.mid(), x.rad())
+
+def _generalized_bernoulli(Ring, sigma, count, *, cache=None):
+    key = ('_generalized_bernoulli', Ring, _ball_key(sigma), count)
+    if cache is not None and key in cache:
+        return cache[key]
+    t = _polygen(Ring, 't')
     ser = t._exp_series(count + 1) >> 1       # (e^t - 1)/t
     ser = -2*sigma*ser._log_series(count)     # -2σ·log((e^t - 1)/t)
     ser = (ser >> 2) << 2                     # -2σ·log((e^t - 1)/t) + σt
     ser = ser._exp_series(count)              # ((e^t - 1)/t)^(-2σ) * e^(σt)
-    bern = [ser[n]*ZZ(n).factorial() for n in range(count)]
+    bern = tuple(ser[n]*ZZ(n).factorial() for n in range(count))
+    if cache is not None:
+        cache[key] = bern
     return bern
 
-def truncated_gamma_ratio(alpha, order, u, s):
+def truncated_gamma_ratio(alpha, order, u, s, *, cache=None):
     """
     Find a truncated expression with error bound for Γ(n+α)/Γ(n+1)/(n+α/2)^(α-1)
 
@@ -773,6 +866,7 @@ def truncated_gamma_ratio(alpha, order, u, s):
     - order: order of truncation
     - u: element of polynomial ring, representing 1/(n+α/2)
     - s: positive number where n >= s*|alpha| is guaranteed, s > 2
+    - cache (keyword, optional): dictionary of intermediate results
 
     OUTPUT:
 
@@ -783,31 +877,51 @@ def truncated_gamma_ratio(alpha, order, u, s):
     Pol = u.parent()
     CB = Pol.base_ring()
     n_gam = ceil((1+order)/2)
-    gen_bern = _generalized_bernoulli(CB, alpha/2, 2*n_gam)
-    gen_bern_abs = _generalized_bernoulli(CB, abs(alpha/2), 2*n_gam + 1)
+    gen_bern = _generalized_bernoulli(CB, alpha/2, 2*n_gam, cache=cache)
+    # Only used in the error term, no need for high precision
+    _alpha = CBF(alpha)
+    gen_bern_abs = _generalized_bernoulli(CBF, abs(_alpha/2), 2*n_gam + 1,
+                                          cache=cache)
 
     ratio_gamma_asy = Pol([CB(1 - alpha).rising_factorial(j) / factorial(j) * b
                            if j % 2 == 0 else 0
                            for j, b in enumerate(gen_bern)])
     half = RBF.one()/2
-    _alpha = CBF(alpha)
     Rnw_bound = (abs((1 - _alpha.real()).rising_factorial(2*n_gam))
                  / factorial(2*n_gam)
                  * abs(gen_bern_abs[2*n_gam])
                  * (abs(_alpha.imag())*(half/s).arcsin()).exp()
-                 * ((s+half)/(s-half))**(max(0, -alpha.real()+1+2*n_gam)))
+                 * ((s+half)/(s-half))**(max(0, -_alpha.real()+1+2*n_gam)))
     assert not Rnw_bound < 0
     ratio_gamma = ratio_gamma_asy + CB(0).add_error(Rnw_bound) * u**(2*n_gam)
     return ratio_gamma
 
+def _pol_from_coeffs(invn, coeffs):
+    # Build sum(coeffs[j]*invn^j) in one go instead of summing monomials
+    Pol = invn.parent()
+    if Pol.ngens() == 1:
+        return Pol(coeffs)
+    (exp,) = invn.exponents()
+    return Pol({exp.emul(j): c for j, c in enumerate(coeffs) if c})
+
+def _powers(x, count):
+    # [x^0, ..., x^(count-1)] by successive multiplications
+    if count <= 0:
+        return []
+    pows = [x.parent().one()]
+    for _ in range(1, count):
+        pows.append(pows[-1]*x)
+    return pows
+
 def truncated_inverse(alpha, order, invn, s):
     r"""
     (n + α)^(-1) as a polynomial in invn = 1/n plus an error term O(invn^order)
     """
     CB = invn.parent().base_ring()
-    err = abs(alpha)**order / (1 - 1/s)
-    ser = sum((-alpha)**(j-1) * invn**j for j in range(1, order))
-    return ser + CB(0).add_error(err) * invn**(order)
+    err = abs(CBF(alpha))**order / (1 - 1/s)
+    coeffs = ([CB.zero()] + _powers(-alpha, order - 1))[:order]
+    coeffs.append(CB(0).add_error(err))
+    return _pol_from_coeffs(invn, coeffs)
 
 def truncated_log(alpha, order, invn, s):
     r"""
@@ -815,10 +929,14 @@ def truncated_log(alpha, order, invn, s):
     """
     CB = invn.parent().base_ring()
     err = (1 + 1/s).log()*abs(CBF(alpha))**order
-    ser = - sum((-alpha)**j * invn**j / j for j in range(1, order))
-    return ser + CB(0).add_error(err) * invn**(order)
-
-def truncated_power(alpha, order, invn, s):
+    pows = _powers(-alpha, order)
+    coeffs = ([CB.zero()] + [-pows[j]/j for j in range(1, order)])[:order]
+    coeffs.append(CB(0).add_error(err))
+    return _pol_from_coeffs(invn, coeffs)
+
+# Needed again by bound_gamma_ratio for each call of bound_coeff_mono with the
+# same exponent
+def truncated_power(alpha, order, invn, s, *, cache=None):
     """
     Compute a bound for a truncated (1 + α/2n)^(α-1)
 
@@ -828,24 +946,47 @@ def truncated_power(alpha, order, invn, s):
     - order: order of truncation
     - invn: element of polynomial ring, representing 1/n
     - s: positive number where n >= s*|alpha| is guaranteed, s > 2
+    - cache (keyword, optional): dictionary where to store the result for
+      reuse in subsequent calls with the same parameters
 
     OUTPUT:
 
     - trunc_power: a polynomial in CB[invn] such that (1 + α/2n)^(α-1) is in its
       range when n >= s*|alpha|
+
+    TESTS::
+
+        sage: from ore_algebra.analytic.singularity_analysis import truncated_power
+        sage: Pol.<invn> = CBF[]
+        sage: p = truncated_power(CBF(1/3), 3, invn, RBF(3))
+        sage: p.degree()
+        3
+        sage: (1 + CBF(1/60))^(-2/3) in p(1/10)
+        True
     """
+    # The key only records the parent of invn, which must be one of its
+    # generators
+    key = ('truncated_power', _ball_key(alpha), order, invn.parent(),
+           _ball_key(s))
+    if cache is not None:
+        assert invn in invn.parent().gens()
+        if key in cache:
+            return cache[key]
     CB = invn.parent().base_ring()
     _alpha = CBF(alpha)
-    a = alpha.real() - 1
+    a = _alpha.real() - 1
     h = RBF(1)/2
     err = (abs(_alpha)**(order) / (1 - 1/s)
-           * (abs(alpha.imag())/2).exp()
+           * (abs(_alpha.imag())/2).exp()
            * max((3*h)**a, h**a))
     assert not err < 0
-    t = polygen(CB, 't')
+    t = _polygen(CB, 't')
     ser = (alpha - 1) * (1 + alpha/2 * t)._log_series(order)
     ser = ser._exp_series(order)
-    return ser(invn) + CB(0).add_error(err) * invn**(order)
+    res = ser(invn) + CB(0).add_error(err) * invn**(order)
+    if cache is not None:
+        cache[key] = res
+    return res
 
 def trim_univariate(pol, order, varbound):
     r"""
@@ -865,31 +1006,84 @@ def trim_expr(f, order, n0):
     Each 1/n^(order+t) (t > 0) is replaced by 1/n^order*CB(0).add_error(1/n0^t);
     factors log(n)^k are left untouched.
     """
+    coeffs = f.dict()
+    n0_pow = _n0_powers(f.base_ring(), n0, _max_invn_degree(coeffs) - order)
+    return _trim_terms(f.parent(), coeffs, order, n0_pow)
+
+def trim_product(f, g, order, n0):
+    """
+    An enclosure of trim_expr(f*g, order, n0), possibly slightly wider,
+    computed without constructing f*g
+
+    Products of terms of total degree > order in invn are folded into the error
+    on the coefficient of invn^order*logn^k as they are produced. The error is
+    thus the sum of |c_f*c_g| instead of |Σ c_f*c_g|, and products with zero
+    midpoint are not kept as they are.
+    """
     Expr = f.parent()
-    invn = Expr.gen(0)
     CB = Expr.base_ring()
-    g = Expr.zero()
-    # TODO: simplify...
-    for c, mon in f:
-        deg = mon.degree(invn)
+    zero = CB.zero()
+    f_terms = f.dict()
+    g_terms = g.dict()
+    # Only used in the error terms
+    n0_pow = _n0_powers(RBF, n0, _max_invn_degree(f_terms)
+                                 + _max_invn_degree(g_terms) - order)
+    g_terms = [(exp_g, c_g, abs(c_g)) for exp_g, c_g in g_terms.items()]
+    terms = {}
+    err = {}
+    for (deg_f, k_f), c_f in f_terms.items():
+        abs_f = abs(c_f)
+        for (deg_g, k_g), c_g, abs_g in g_terms:
+            deg, k = deg_f + deg_g, k_f + k_g
+            if deg <= order:
+                terms[deg, k] = terms.get((deg, k), zero) + c_f*c_g
+            else:
+                err[k] = err.get(k, 0) + abs_f*abs_g/n0_pow[deg - order]
+    for k, e in err.items():
+        terms[order, k] = terms.get((order, k), zero).add_error(e)
+    return Expr(terms)
+
+def _max_invn_degree(coeffs):
+    return max((exp[0] for exp in coeffs), default=0)
+
+def _n0_powers(CB, n0, count):
+    # [n0^0, ..., n0^count] (at least [1])
+    return [CB(n0**t) for t in range(max(0, count) + 1)]
+
+def _trim_terms(Expr, coeffs, order, n0_pow):
+    # coeffs: exponent dictionary of an element of Expr = CB[invn, logn],
+    # n0_pow: table of powers of n0 long enough for the terms to be trimmed
+    CB = Expr.base_ring()
+    zero = CB.zero()
+    # Work on the exponent dictionary and build the result in a single call
+    # instead of summing monomials one by one.
+    terms = {}
+    for (deg, k), c in coeffs.items():
         if deg > order:
-            tuple_mon_g = tuple(map(lambda x, y: x - y, mon.exponents()[0],
-                                    (invn**(deg - order)).exponents()[0]))
-            mon_g = prod(Expr.gens()[j]**(tuple_mon_g[j])
-                         for j in range(len(tuple_mon_g)))
-            c_g = ((c if c.mid() == 0 else CB(0).add_error(abs(c)))
-                   / CB(n0**(deg - order)))
-            g = g + c_g * mon_g
-        else:
-            g = g + c*mon
-    return g
+            c = ((c if c.mid() == 0 else CB(0).add_error(abs(c)))
+                 / n0_pow[deg - order])
+            deg = order
+        terms[deg, k] = terms.get((deg, k), zero) + c
+    return Expr(terms)
 
 def trim_expr_series(f, order, n0):
-    trimmed = f.parent()([trim_expr(c, order, n0) for c in f])
+    # Share the table of powers of n0 between the coefficients
+    coeffs = [c.dict() for c in f]
+    Expr = f.base_ring()
+    max_deg = max((_max_invn_degree(c) for c in coeffs), default=0)
+    n0_pow = _n0_powers(Expr.base_ring(), n0, max_deg - order)
+    trimmed = f.parent()([_trim_terms(Expr, c, order, n0_pow) for c in coeffs])
     return trimmed.add_bigoh(f.parent().default_prec())
 
-def bound_gamma_ratio(Expr, exact_alpha, order, n0, s):
+# Independent of log_order, hence shared by all calls to bound_coeff_mono with
+# the same exponent
+def bound_gamma_ratio(Expr, exact_alpha, order, n0, s, *, cache=None):
     # fg = n^(1-α) Γ(n+α)/Γ(n+1)
+    # (Expr does not change during a call to bound_coefficients(), hence is not
+    # part of the key)
+    key = ('bound_gamma_ratio', exact_alpha, order, n0, _ball_key(s))
+    if cache is not None and key in cache:
+        return cache[key]
     CB = Expr.base_ring()
     invn, _ = Expr.gens()
     alpha = CB(exact_alpha)
@@ -900,18 +1094,21 @@ def bound_gamma_ratio(Expr, exact_alpha, order, n0, s):
         logger.debug("    fg = %s", fg)
     else:
         # (n+α/2)^(1-α) * Γ(n+α)/Γ(n+1)
-        u = polygen(CB, 'u') # u stands for 1/(n+α/2)
-        f = truncated_gamma_ratio(alpha, order, u, s)
+        u = _polygen(CB, 'u') # u stands for 1/(n+α/2)
+        f = truncated_gamma_ratio(alpha, order, u, s, cache=cache)
         truncated_u = truncated_inverse(alpha/2, order, invn, s)
         f = trim_expr(f(truncated_u), order, n0)
         logger.debug("    f = %s", f)
         # (1 + α/2n)^(α-1) = (n+α/2)^(α-1) * n^(1-α)
-        g = truncated_power(alpha, order, invn, s)
+        g = truncated_power(alpha, order, invn, s, cache=cache)
         logger.debug("    g = %s", g)
-        fg = trim_expr(f*g, order, n0)
+        fg = trim_product(f, g, order, n0)
+    if cache is not None:
+        cache[key] = fg
     return fg
 
-def bound_gamma_ratio_derivatives(Expr, exact_alpha, log_order, order, n0, s):
+def bound_gamma_ratio_derivatives(Expr, exact_alpha, log_order, order, n0, s,
+                                  *, cache=None):
     CB = Expr.base_ring()
     invn, logn = Expr.gens()
     alpha = CB(exact_alpha)
@@ -919,16 +1116,18 @@ def bound_gamma_ratio_derivatives(Expr, exact_alpha, log_order, order, n0, s):
     # Bound for 1/Γ(n+α) (d/dα)^k [Γ(n+α)/Γ(α)]
     # Use PowerSeriesRing because polynomials do not implement all the
     # "truncated" operations we need
-    Pol_invz, invz = PolynomialRing(CB, 'invz').objgen() # z = n + α
+    invz = _polygen(CB, 'invz') # z = n + α
+    Pol_invz = invz.parent()
     Series_z, eps = PowerSeriesRing(Pol_invz, 'eps', log_order).objgen()
     order_psi = max(1, ceil(order/2))
     if not (exact_alpha.parent() is ZZ and exact_alpha <= 0):
-        pols = [(truncated_psi(m, order_psi, invz) - alpha.psi(m))
+        pols = [(truncated_psi(m, order_psi, invz, cache=cache)
+                 - alpha.psi(m))
                 / (m + 1).factorial() for m in srange(log_order)]
         p = Series_z([0] + pols)
         hh1 = (1/alpha.gamma())*p.exp()
     else:
-        pols = [(truncated_psi(m, order_psi, invz)
+        pols = [(truncated_psi(m, order_psi, invz, cache=cache)
                  + (-1)**(m+1)*(1-alpha).psi(m)) / (m + 1).factorial()
                 for m in srange(log_order - 1)]
         p = Series_z([0] + pols)
@@ -937,8 +1136,7 @@ def bound_gamma_ratio_derivatives(Expr, exact_alpha, log_order, order, n0, s):
         hh1 = ((1-alpha).gamma()/_pi)*(p.exp()*sine)
     # XXX use s instead?
     invz_bound = ~(n0 - abs(alpha))
-    hh1 = hh1.parent()([trim_univariate(c, order, invz_bound)
-                        for k, c in enumerate(hh1)])
+    hh1 = hh1.parent()([trim_univariate(c, order, invz_bound) for c in hh1])
 
     Series, eps = PowerSeriesRing(Expr, 'eps', log_order).objgen()
     truncated_invz = truncated_inverse(alpha, order, invn, s)
@@ -959,7 +1157,8 @@ def bound_gamma_ratio_derivatives(Expr, exact_alpha, log_order, order, n0, s):
     h = trim_expr_series(h, order, n0)
     return h
 
-def bound_coeff_mono(Expr, alpha, log_order, order, n0, s):
+# Shared between exponent groups and singularities with common exponents
+def bound_coeff_mono(Expr, alpha, log_order, order, n0, s, *, cache=None):
     """
     Bound [z^n] (1-z)^(-α) * log(1/(1-z))^k by an expression
     of the form n^(α-1) * P(1/n, log(n)) for all k < log_order
@@ -972,30 +1171,41 @@ def bound_coeff_mono(Expr, alpha, log_order, order, n0, s):
     - order: expansion order wrt n
     - n0: integer > -alpha, lower bound of validity range
     - s: real number > 2 s.t. n >= s*|alpha| for all n >= n0
+    - cache (keyword, optional): dictionary where to store the result for
+      reuse in subsequent calls with the same parameters
 
     OUTPUT:
 
-    - a list of length log_order of polynomials P in invn, logn,
+    - a tuple of length log_order of polynomials P in invn, logn,
       corresponding to k = 0, ..., log_order - 1
     """
     # All entries can probably be deduced from the last one using Frobenius'
     # method, but I don't think it helps much computationally(?)
 
+    # (Expr does not change during a call to bound_coefficients(), hence is not
+    # part of the key)
+    key = ('bound_coeff_mono', alpha, log_order, order, n0, _ball_key(s))
+    if cache is not None and key in cache:
+        return cache[key]
+
     if alpha.is_integer():
         alpha = ZZ(alpha)
 
     order = max(0, order)
 
-    fg = bound_gamma_ratio(Expr, alpha, order, n0, s)
-    h = bound_gamma_ratio_derivatives(Expr, alpha, log_order, order, n0, s)
+    fg = bound_gamma_ratio(Expr, alpha, order, n0, s, cache=cache)
+    h = bound_gamma_ratio_derivatives(Expr, alpha, log_order, order, n0, s,
+                                      cache=cache)
 
     full_prod = fg * h
     full_prod = trim_expr_series(full_prod, order, n0)
-    res = [ZZ(k).factorial()*c
-           for k, c in enumerate(full_prod.padded_list(log_order))]
+    res = tuple(ZZ(k).factorial()*c
+                for k, c in enumerate(full_prod.padded_list(log_order)))
     for k, pol in enumerate(res):
         logger.debug("    1/(1-z)^(%s)*log(1/(1-z))^%s --> %s",
                      alpha, k, pol)
+    if cache is not None:
+        cache[key] = res
     return res
 
 #################################################################################
@@ -1014,17 +1224,23 @@ def _my_log_series(bwrec, inivec, leftmost, mults, struct, order):
     """
     log_len = sum(m for _, m in mults)
     res = [[inivec.base_ring().zero()]*log_len for _ in range(order)]
-    for sol, c in zip(struct, inivec):
-        if c.is_zero() or sol.leftmost.as_algebraic() != leftmost.as_algebraic():
+    _leftmost = leftmost.as_algebraic()
+    in_class = [(sol, c) for sol, c in zip(struct, inivec)
+                if sol.leftmost.as_algebraic() == _leftmost]
+    for sol, c in in_class:
+        if c.is_zero():
             continue
         values = { (sol1.shift, sol1.log_power): QQ.zero()
-                   for sol1 in struct if sol1.leftmost.as_algebraic() == leftmost.as_algebraic() }
+                   for sol1, _ in in_class }
         values[sol.shift, sol.log_power] = QQ.one()
         ini = LogSeriesInitialValues(expo=leftmost, values=values, mults=mults)
         ser = log_series(ini, bwrec, order)
-        for i in range(order):
-            for j, a in enumerate(ser[i]):
-                res[i][j] += c*a
+        # Most coefficients are zero (in particular those of high powers of
+        # log), skip them instead of multiplying c by an exact zero
+        for row, vec in zip(res, ser):
+            for j, a in enumerate(vec):
+                if a:
+                    row[j] += c*a
     return res
 
 ExponentGroupData = collections.namedtuple('ExponentGroupData', [
@@ -1041,24 +1257,49 @@ SingularityData = collections.namedtuple('SingularityData', [
 ])
 
 class SingularityAnalyzer(LocalBasisMapper):
+    r"""
+    Compute the contribution of each exponent group of the local expansion at
+    ρ of a solution given by its coordinates ``inivec`` in the local basis
+
+    TESTS:
+
+    Groups on which the solution has no component are skipped::
+
+        sage: from ore_algebra import OreAlgebra
+        sage: from ore_algebra.analytic.differential_operator import DifferentialOperator
+        sage: from ore_algebra.analytic.path import Point
+        sage: from ore_algebra.analytic.singularity_analysis import SingularityAnalyzer
+        sage: Pols.<z> = QQ[]
+        sage: Dops.<Dz> = OreAlgebra(Pols)
+        sage: dop = DifferentialOperator(2*(1-z)^2*Dz^2 - 3*(1-z)*Dz - 1) # 1/(1-z), sqrt(1-z)
+        sage: pt = Point(1, dop)
+        sage: struct = pt.local_basis_structure()
+        sage: ini = vector(CBF, [1 if sol.leftmost.as_algebraic() == -1 else 0
+        ....:                    for sol in struct])
+        sage: Expr = PolynomialRing(CBF, ['invn', 'logn'], order='lex')
+        sage: analyzer = SingularityAnalyzer(dop.shift(pt), ini, rho=1, rad=2,
+        ....:         Expr=Expr, rel_order=2, n0=100, local_basis_structure=struct)
+        sage: [QQbar(sol.value.val) for sol in analyzer.run()]
+        [-1]
+    """
 
-    def __init__(self, dop, inivec, *, rho, rad, Expr, rel_order, n0):
+    def __init__(self, dop, inivec, *, rho, rad, Expr, rel_order, n0,
+                 local_basis_structure, cache=None):
 
         super().__init__(dop)
 
         self.inivec = inivec
+        self._local_basis_structure = local_basis_structure
         self.rho = rho
         self.rad = rad
         self.Expr = Expr
         self.n0 = n0
         self.rel_order = rel_order
+        self.cache = cache
 
     def run(self):
-        # Redundant work; TBI.
-        # (Cases where we really need this to detect non-analyticity are
-        # rare...)
-        self._local_basis_structure = Point(0, self.dop).local_basis_structure()
-
+        # (Cases where we really need the local basis structure to detect
+        # non-analyticity are rare...)
         nonanalytic = [sol for sol in self._local_basis_structure if not (
             sol.leftmost.as_algebraic().is_integer()
             and sol.leftmost.as_algebraic() + sol.shift >= 0
@@ -1078,6 +1319,14 @@ class SingularityAnalyzer(LocalBasisMapper):
 
         logger.info("sing=%s, valuation=%s", self.rho, QQbar(self.leftmost))
 
+        # Nothing to do if the solution has no component in this group
+        _leftmost = self.leftmost.as_algebraic()
+        if all(c.is_zero()
+               for sol, c in zip(self._local_basis_structure, self.inivec)
+               if sol.leftmost.as_algebraic() == _leftmost):
+            logger.debug("no component with these exponents")
+            return
+
         order = (self.abs_order - self.re_leftmost).ceil()
         # TODO: consider increasing order1 adaptively, like we do with
         # pol_part_len (via maj.refine()) in _bound_local_integral_of_tail
@@ -1100,7 +1349,7 @@ class SingularityAnalyzer(LocalBasisMapper):
 
         bound_lead_terms, initial_terms = _bound_local_integral_explicit_terms(
                 self.Expr, self.rho, self.leftmost.as_algebraic(), order, s,
-                self.n0, ser[:order])
+                self.n0, ser[:order], self.cache)
 
         # TODO: move to _bound_local_integral_of_tail(?), simplify arguments,
         # avoid calling _bound_tail in analytic case
@@ -1176,8 +1425,11 @@ def _bound_tail(dop, leftmost, order, ind_roots, shifts, smallrad, series):
             break
         maj.refine()
     # Bound on the intermediate terms
-    ib = sum(smallrad**n1 * max(c.above_abs() for c in vec)
-            for n1, vec in enumerate(series[order:]))
+    ib = RBF.zero()
+    radpow = RBF.one()
+    for vec in series[order:]:
+        ib += radpow * max(c.above_abs() for c in vec)
+        radpow *= smallrad
     # Same as tb, but for the tail of order 'order'
     return tb + ib
 
@@ -1204,7 +1456,7 @@ def _bound_local_integral_of_tail(Expr, rho, val_rho, order, s, n0, vb, kappa):
     # val_rho is an integer and val_rho + order >= 0. This is no big deal here
     # (unlike above) since one can always increase the expansion order.
 
-    invn, logn = Expr.gens()
+    _, logn = Expr.gens()
 
     _pi = RBF(pi)
     _rho = CBF(rho)
@@ -1237,9 +1489,10 @@ def _bound_local_integral_of_tail(Expr, rho, val_rho, order, s, n0, vb, kappa):
     err_L = C_nur/_pi * abs(_rho)**beta * A
     bound_L = CBF(0).add_error(err_L)*Bpi
 
-    return Expr(bound_S + bound_L) * invn**order
+    return Expr(bound_S + bound_L) * Expr.monomial(order, 0)
 
-def _bound_local_integral_explicit_terms(Expr, rho, val_rho, order, s, n0, ser):
+def _bound_local_integral_explicit_terms(Expr, rho, val_rho, order, s, n0, ser,
+                                         cache=None):
     r"""
     Bound the coefficient of z^n in the expansion at the origin of the initial
     terms of the local expansion at ρ whose coefficients are given in ser.
@@ -1260,29 +1513,29 @@ def _bound_local_integral_explicit_terms(Expr, rho, val_rho, order, s, n0, ser):
     assert order >= 0
     assert n0 > s*(abs(val_rho) + order)
 
-    invn, _ = Expr.gens()
     CB = Expr.base_ring()
 
     # Rewrite the local expansion in terms of new variables Z = z - ρ,
     # L = log(1/(1-z/rho))
 
-    PolL, L = PolynomialRing(CB, 'L').objgen()
-    PolL, Z = PolynomialRing(PolL, 'Z').objgen()
+    L = _polygen(CB, 'L')
+    Z = _polygen(L.parent(), 'Z')
+    PolL = Z.parent()
     mylog = CB.coerce(-rho).log() - L # = log(z - ρ) for Im(z) ≥ 0
-    locf_ini_terms = sum(c/ZZ(k).factorial() * mylog**k * Z**shift
-                         for shift, vec in enumerate(ser)
-                         for k, c in enumerate(vec))
+    mylog_pow = _powers(mylog, max(len(vec) for vec in ser))
+    locf_ini_terms = PolL([
+        sum(c/ZZ(k).factorial() * mylog_pow[k] for k, c in enumerate(vec))
+        for vec in ser])
 
     bound_lead_terms = Expr.zero()
     _minus_val_rho = QQbar(-val_rho)
     for degZ, slice in enumerate(locf_ini_terms):
         logger.debug("  (z - %s)^(%s + %s)*(...)...",
                      rho, _minus_val_rho, degZ)
-        # XXX could be shared between singularities with common exponents...
-        # (=> tie to an object and add @cached_method decorator?)
         coeff_bounds = bound_coeff_mono(Expr, _minus_val_rho - degZ,
-                                        slice.degree() + 1, order - degZ, n0, s)
-        new_term = (CB(-rho)**CB(val_rho+degZ) * invn**(degZ)
+                                        slice.degree() + 1, order - degZ, n0, s,
+                                        cache=cache)
+        new_term = (CB(-rho)**CB(val_rho+degZ) * Expr.monomial(degZ, 0)
                     * sum(c*coeff_bounds[degL] for degL, c in enumerate(slice)))
         bound_lead_terms += new_term
         logger.debug("  (z - %s)^(%s)*(%s) --> %s",
@@ -1290,7 +1543,8 @@ def _bound_local_integral_explicit_terms(Expr, rho, val_rho, order, s, n0, ser):
 
     return bound_lead_terms, locf_ini_terms
 
-def contribution_single_singularity(deq, ini, rho, rad, Expr, rel_order, n0):
+def contribution_single_singularity(deq, ini, rho, rad, Expr, rel_order, n0,
+                                     point=None, cache=None):
     r"""
     Bound the integral over a small loop around ρ, connecting to the big circle
     of radius rad, of 1/(2πi)*f(z)/z^{n+1} where f is the solution of deq
@@ -1300,6 +1554,12 @@ def contribution_single_singularity(deq, ini, rho, rad, Expr, rel_order, n0):
     of _bound_local_integral_explicit_terms(). The bound is valid for all
     n >= n0.
 
+    If given, ``point`` should be ``Point(rho, deq)``; passing a Point that has
+    already been used elsewhere allows for reusing its local basis structure.
+
+    Similarly, ``cache`` is a dictionary of intermediate results (see
+    bound_coeff_mono()) that may be shared with other singularities.
+
     Some ancillary data is returned for each contribution, including an
     expression of the associated local expansion at ρ of a component of f (see
     _bound_local_integral_explicit_terms()).
@@ -1311,14 +1571,19 @@ def contribution_single_singularity(deq, ini, rho, rad, Expr, rel_order, n0):
     coord_all = tmat*ini
     logger.info("done")
 
-    ldop = deq.shift(Point(rho, deq))
+    if point is None:
+        point = Point(rho, deq)
+    ldop = deq.shift(point)
 
     # Split the local expansion of f according to the local exponents mod ℤ. For
     # each group (ℤ-coset) of exponents, compute coefficient asymptotics (and
     # some auxiliary data). Again: each element of the output corresponds to a
     # whole ℤ-coset of exponents, already incorporating initial values.
     analyzer = SingularityAnalyzer(dop=ldop, inivec=coord_all, rho=rho, rad=rad,
-                                   Expr=Expr, rel_order=rel_order, n0=n0)
+                                   Expr=Expr, rel_order=rel_order, n0=n0,
+                                   local_basis_structure=
+                                        point.local_basis_structure(),
+                                   cache=cache)
     data = analyzer.run()
 
     data1 = SingularityData(
@@ -1332,6 +1597,9 @@ def contribution_single_singularity(deq, ini, rho, rad, Expr, rel_order, n0):
 # Exponentially small error term
 ################################################################################
 
+def _conjugate_pairs(pairs):
+    return [(CBF(z).conjugate(), val.conjugate()) for z, val in pairs]
+
 def numerical_sol_big_circle(deq, ini, dominant_sing, rad, halfside):
     """
     Bound the values of a solution `f` on the large circle
@@ -1350,6 +1618,33 @@ def numerical_sol_big_circle(deq, ini, dominant_sing, rad, halfside):
     and, for each square, the corresponding value is a complex interval
     containing the image of the square by the analytic continuation of `f` to a
     multi-slit disk.
+
+    TESTS:
+
+    Real operator with conjugate dominant singularities; the values on one of
+    the sectors are deduced by symmetry from those on another one::
+
+        sage: from ore_algebra import OreAlgebra
+        sage: from ore_algebra.analytic.singularity_analysis import numerical_sol_big_circle
+        sage: Pols.<z> = QQ[]
+        sage: Dops.<Dz> = OreAlgebra(Pols)
+        sage: deq = (z^3 + 1)*Dz + 3*z^2 # 1/(1+z^3)
+        sage: dom = (z^3 + 1).roots(QQbar, multiplicities=False)
+        sage: halfside = min(abs(abs(ex) - 2) for ex in dom + [0])/10
+        sage: pairs = numerical_sol_big_circle(deq, [1], dom, 2, halfside)
+
+    Compare with the result of a computation where the symmetry is not used
+    (initial values in a complex field)::
+
+        sage: ref = numerical_sol_big_circle(deq, vector(CBF, [1]), dom, 2, halfside)
+        sage: len(pairs) == len(ref)
+        True
+        sage: all(any(CBF(sq).overlaps(CBF(sq1)) for sq1, _ in ref)
+        ....:     for sq, _ in pairs)
+        True
+        sage: all(val.overlaps(val1) for sq, val in pairs for sq1, val1 in ref
+        ....:     if CBF(sq).overlaps(CBF(sq1)))
+        True
     """
     logger.info("starting to compute values on outer circle...")
     clock = utilities.Clock()
@@ -1359,19 +1654,35 @@ def numerical_sol_big_circle(deq, ini, dominant_sing, rad, halfside):
     # TODO: eps could be chosen as a function of halfside or something...
     eps = RBF.one() >> 100
     halfside = RBF(halfside)
+    side_len = 2*halfside
+    two_pi = 2*RBF.pi()
 
+    dominant_sing = sorted(dominant_sing, key=lambda s: CBF(s).arg())
     sings = [CBF(s) for s in dominant_sing]
-    sings.sort(key=lambda s: s.arg())
     num_sings = len(sings)
+    # With real coefficients and initial values, f(conj(z)) = conj(f(z)), so,
+    # when the slits are symmetric, we can deduce the values on each arc from
+    # those on its mirror image
+    symmetric = (utilities.is_real_parent(deq.base_ring().base_ring())
+                 and utilities.is_real_parent(vector(ini).base_ring())
+                 and all(s.conjugate() in dominant_sing for s in dominant_sing))
+    sector_pairs = {}
     pairs = []
     for j0 in range(num_sings):
         j1 = (j0 + 1) % num_sings
+        if symmetric:
+            # index of the sector whose conjugate is the current sector
+            k0 = dominant_sing.index(dominant_sing[j1].conjugate())
+            if k0 in sector_pairs:
+                logger.info("  sector %d, conjugate of sector %d", j0, k0)
+                pairs += _conjugate_pairs(sector_pairs[k0])
+                continue
         arg0 = sings[j0].arg()
         arg1 = sings[j1].arg()
         if j1 == 0:
             # last arc is a bit special: we need to add 2*pi to the argument of
             # the end
-            arg1 += 2*RBF.pi()
+            arg1 += two_pi
 
         # Compute initial values at a point on the large circle, halfway between
         # two adjacent dominant singularities. We need an exact point for the
@@ -1392,45 +1703,77 @@ def numerical_sol_big_circle(deq, ini, dominant_sing, rad, halfside):
 
         # From there, walk along the large circle in both directions
         halfarc = (arg1 - arg0)/2
-        np = ZZ(((halfarc*rad / (2*halfside)).above_abs()).ceil()) + 2
+        np = ZZ(((halfarc*rad / side_len).above_abs()).ceil()) + 2
 
         logger.info("  sector %d, %d squares of half-side %s", j0, np, halfside)
-        # TODO: optimize case of real coefficients
         # TODO: check path correctness (plot?) in complex cases
+        cur = []
         for side in [1, -1]:
-            squares = [[(hub*(side*halfarc*k/np*I).exp()).add_error(halfside)]
+            if side == -1 and symmetric and k0 == j0:
+                # The sector is its own mirror image (and hub is close enough
+                # to the real axis for the first square to cover it)
+                cur += _conjugate_pairs(cur)
+                break
+            dtheta = side*halfarc/np*I
+            squares = [[(hub*(k*dtheta).exp()).add_error(halfside)]
                        for k in range(np+1)]
             path = [hub] + squares
-            pairs += deq.numerical_solution(ini_hub, path, eps)
+            cur += deq.numerical_solution(ini_hub, path, eps)
+        sector_pairs[j0] = cur
+        pairs += cur
 
     clock.toc()
     logger.info("...done, %s", clock)
     return pairs
 
+def _eval_initial_terms(pol, Z, L):
+    # Horner scheme wrt Z, each coefficient being a polynomial in L
+    res = CBF.zero()
+    for c in reversed(list(pol)):
+        res = res*Z + c(L)
+    return res
+
 def max_big_circle(deq, ini, dominant_sing, sing_data, rad, halfside):
 
     pairs = numerical_sol_big_circle(deq, ini, dominant_sing, rad, halfside)
-    covering, f_big_circle = zip(*pairs)
-
-    sum_g = [
-        sum((_z-_rho)**(CBF(edata.val))
-                # some of the _z may lead to arguments of log that cross the
-                # branch cut, but that's okay
-                * edata.initial_terms(Z=_z-_rho, L=(~(1-_z/_rho)).log())
-            for sdata in sing_data for _rho in (CBF(sdata.rho),)
-            for edata in sdata.expo_group_data)
-        for j, _z in enumerate(covering)]
-    res = RBF.zero().max(*((s - vv).above_abs()
-                           for s, vv in zip(sum_g, f_big_circle)))
+
+    # Per-singularity data, converted once for all points
+    local_data = [(CBF(sdata.rho),
+                   [(CBF(edata.val), edata.initial_terms)
+                    for edata in sdata.expo_group_data])
+                  for sdata in sing_data]
+
+    def g(_z, _rho, expo_group_data):
+        Z = _z - _rho
+        # some of the _z may lead to arguments of log that cross the branch
+        # cut, but that's okay
+        L = (~(1-_z/_rho)).log()
+        return sum(Z**val * _eval_initial_terms(initial_terms, Z, L)
+                   for val, initial_terms in expo_group_data)
+
+    # Single pass over the covering, reducing as we go
+    res = RBF.zero()
+    for _z, f_z in pairs:
+        sum_g = sum(g(_z, _rho, expo_group_data)
+                    for _rho, expo_group_data in local_data)
+        # The upper bounds are exact balls, so comparing them is enough (but
+        # make sure not to lose non-finite values)
+        m = (sum_g - f_z).above_abs()
+        if not m <= res:
+            res = m
+            if not res.is_finite():
+                break
     return res
 
 def absorb_exponentially_small_term(CB, cst, ratio, beta, final_kappa, n0, n):
-    if beta <= n0 * ratio.log():
+    log_ratio = ratio.log()
+    _n0 = CBF(n0)
+    if beta <= n0 * log_ratio:
         _beta = RBF(beta)
-        cst1 = _beta.exp()*(_beta/ratio.log())**(-_beta)
+        cst1 = _beta.exp()*(_beta/log_ratio)**(-_beta)
     else:
-        cst1 = ratio**n0 * CBF(n0)**(-beta)
-    rad_err = cst*cst1 / CBF(n0).log()**final_kappa
+        cst1 = ratio**n0 * _n0**(-beta)
+    rad_err = cst*cst1 / _n0.log()**final_kappa
     return (CB(0).add_error(rad_err) * n**QQbar(beta) * log(n)**final_kappa)
 
 def add_error_term(bound, rho, term, n):
@@ -1439,9 +1782,9 @@ def add_error_term(bound, rho, term, n):
             # We know that the last term is an error term with the same
             # power of n and log(n) as error_term_big_circle
             local_bound[-1] = (local_bound[-1] + term).collect(n)
-        break
+            break
     else:
-        bound.append([rho, term])
+        bound.append([rho, [term]])
 
 ################################################################################
 # Conversion to an asymptotic expansion
@@ -1497,9 +1840,6 @@ def to_asymptotic_expansion(Coeff, name, term_data, n0, beta, kappa, rad,
       B-term; otherwise, ignored except when ``beta`` is -∞.
     """
 
-    from sage.categories.cartesian_product import cartesian_product
-    from sage.rings.asymptotic.asymptotic_ring import AsymptoticRing
-
     n = SR.var(name)
 
     # TODO: detect cases where we can use 1 or ±1 or U as Arg
@@ -1553,7 +1893,7 @@ def to_asymptotic_expansion(Coeff, name, term_data, n0, beta, kappa, rad,
         for symterm in symterms:
             if symterm.is_trivial_zero():
                 continue
-            term = arg_factor*ET(symterm.subs(n=n))
+            term = arg_factor*ET(symterm)
             term_growth = _remove_non_growth_factors(term.growth)
             if alg_error_growth is not None and term_growth == alg_error_growth:
                 assert term.coefficient.contains_zero()
@@ -1617,7 +1957,8 @@ def _bound_validity_range(n0, dominant_sing, order):
 
     # Make sure that n0 > 2*|α| for all exponents α we encounter
 
-    # TODO: avoid redundant computation...
+    # The local basis structures are cached and reused by
+    # contribution_single_singularity()
     max_abs_val = max(abs(sol.leftmost.as_ball(CBF))
                       for s0 in dominant_sing
                       for sol in s0.local_basis_structure())
@@ -1648,24 +1989,56 @@ def truncate_tail_SR(val, re_val, f, beta, kappa, n0, n):
 
     a list of symbolic expressions whose sum forms the new bound
     """
-    Expr = f.parent()
-    CB = Expr.base_ring()
-    invn, logn = Expr.gens()
+    explicit, error_coeff = _truncate_tail_core(f, re_val, beta, kappa, n0)
     g = []
-    error_term = SR.zero()
-    for deg_invn in range(f.degree(invn) + 1):
-        for c, mon in list(f.coefficient({invn: deg_invn})):
-            deg_logn = mon.degree(logn)
-            if re_val - deg_invn > beta:
-                g.append(c * n**(val - deg_invn) * log(n)**deg_logn)
-            else:
-                c_g = (((c if c.mid() == 0 else CB(0).add_error(abs(c)))
-                        / CB(n0)**(beta + deg_invn - re_val))
-                       * CB(n0).log()**(deg_logn - kappa))
-                error_term += c_g * n**beta * log(n)**kappa
-    g.append(error_term)
+    # Symbolic factors of the explicit terms
+    n_pow = {}
+    log_n_pow = {}
+    for (deg_invn, deg_logn), c in explicit:
+        if deg_invn not in n_pow:
+            n_pow[deg_invn] = n**(val - deg_invn)
+        if deg_logn not in log_n_pow:
+            log_n_pow[deg_logn] = log(n)**deg_logn
+        g.append(c * n_pow[deg_invn] * log_n_pow[deg_logn])
+    # The error terms all have the form cst*n^β*log(n)^κ
+    if error_coeff is None:
+        g.append(SR.zero())
+    else:
+        g.append(error_coeff * n**beta * log(n)**kappa)
     return g
 
+def _truncate_tail_core(f, re_val, beta, kappa, n0):
+    r"""
+    Numerical part of truncate_tail_SR()
+
+    Return the list of terms ((deg_invn, deg_logn), c) of f that are kept
+    as they are, and the sum of the constants of the error terms (None if
+    there are none).
+    """
+    CB = f.parent().base_ring()
+    explicit = []
+    error_coeff = None
+    # Scaling factors of the error terms, by power of invn and of logn
+    _n0 = CB(n0)
+    _log_n0 = _n0.log()
+    n0_pow = {}
+    log_n0_pow = {}
+    # By increasing powers of invn, then by decreasing powers of logn
+    terms = sorted(f.dict().items(), key=lambda t: (t[0][0], -t[0][1]))
+    for (deg_invn, deg_logn), c in terms:
+        if re_val - deg_invn > beta:
+            explicit.append(((deg_invn, deg_logn), c))
+            continue
+        if deg_invn not in n0_pow:
+            n0_pow[deg_invn] = _n0**(beta + deg_invn - re_val)
+        if deg_logn not in log_n0_pow:
+            log_n0_pow[deg_logn] = _log_n0**(deg_logn - kappa)
+        c_g = (((c if c.mid() == 0 else CB(0).add_error(abs(c)))
+                / n0_pow[deg_invn])
+               * log_n0_pow[deg_logn])
+        error_coeff = c_g if error_coeff is None else error_coeff + c_g
+    return explicit, error_coeff
+
 def bound_coefficients(deq, seqini, name='n', order=3, prec=53, n0=0, *,
                        known_analytic=[0], rad=None, halfside=None,
                        output='asymptotic_expansion',
@@ -1717,30 +2090,33 @@ def bound_coefficients(deq, seqini, name='n', order=3, prec=53, n0=0, *,
         raise ValueError(f"unknown output format: {output}")
 
     CB = ComplexBallField(prec)
+    # Ring of coefficient bounds, shared by all singularities
+    Expr = PolynomialRing(CB, ['invn', 'logn'], order='lex')
+    invn, logn = Expr.gens()
+    # Intermediate results shared by all singularities and exponent groups
+    # during this call
+    cache = {}
 
     deq = DifferentialOperator(deq)
 
+    # Convert initial sequence terms to solution coordinates in the basis at 0
+    ini = _coeff_zero(seqini, deq)
+
     while True:
 
         # Identify dominant singularities, choose big radius
         all_exn_pts, dominant_sing, rad1 = _classify_sing(deq, known_analytic, rad)
 
         # Compute validity range
-        # TODO: also use Points elsewhere when relevant
         _dominant_sing = [Point(s, deq) for s in dominant_sing]
         n0 = _bound_validity_range(n0, _dominant_sing, order)
 
-        # Convert initial sequence terms to solution coordinates in the basis at 0
-        ini = _coeff_zero(seqini, deq)
-
         # Contribution of each singular point
 
-        Expr = PolynomialRing(CB, ['invn', 'logn'], order='lex')
-        invn, logn = Expr.gens()
-
         sing_data = [contribution_single_singularity(deq, ini, rho, rad1, Expr,
-                                                    order, n0)
-                    for rho in dominant_sing]
+                                                    order, n0, point=pt,
+                                                    cache=cache)
+                    for rho, pt in zip(dominant_sing, _dominant_sing)]
 
         if all(sdata.expo_group_data == [] for sdata in sing_data):
             known_analytic.extend(dominant_sing)
@@ -1819,9 +2195,18 @@ def eval_bound(bound, n_num, prec=53):
     Evaluation of a bound in "list" form
     """
     CBFp = ComplexBallField(prec)
-    list_eval = [rho**(-n_num) * sum(term.subs(n=n_num) for term in ser)
-                 for rho, ser in bound]
-    return CBFp(sum(list_eval))
+    # Raising ρ to the power -n loses about log2(n) bits of relative accuracy,
+    # compensate by converting ρ at a higher precision (exact powers of
+    # algebraic numbers get very large)
+    extra_prec = ZZ(RBF(n_num).above_abs().upper().ceil()).nbits()
+    CBFw = ComplexBallField(prec + extra_prec)
+    # Convert each term as soon as possible instead of building a large
+    # symbolic sum
+    acc = CBFp.zero()
+    for rho, ser in bound:
+        acc += (CBFp(CBFw(rho)**(-n_num))
+                * sum((CBFp(term.subs(n=n_num)) for term in ser), CBFp.zero()))
+    return acc
 
 # TODO: better test the tester
 def check_seq_bound(asy, ref, indices=None, *, verbose=False, force=False):
@@ -1862,13 +2247,16 @@ def check_seq_bound(asy, ref, indices=None, *, verbose=False, force=False):
         except TypeError:
             rb = validity + 10
         indices = range(validity, rb)
+    one = myRBF.one()
+    zero = myCBF.zero()
     for n in indices:
         if n < validity and not force:
             continue
         bn = myRBF(n)
-        one = myRBF.one()
         refval = ref[n]
-        asyval = exact_part.substitute({name: bn})
+        # Bypass the argument processing and parent discovery of substitute()
+        asyval = exact_part._substitute_({name: bn, '_one_': one,
+                                          '_zero_': zero})
         err0 = bterm.growth._substitute_({name: bn, '_one_': one})
         relbound = (asyval - refval)/err0
         if relbound not in error_ball: